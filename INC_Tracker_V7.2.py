@@ -1,24 +1,28 @@
 import os
+import re
 import sys
-import shutil
-import ctypes
+import threading
+import importlib.util
+from contextlib import contextmanager
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 
-from PySide6.QtCore import Qt, QDate, QPoint, QSize, QPointF, QRectF
+from PySide6.QtCore import (
+    Qt, QDate, QPoint, QPointF, QRectF, QObject, QRunnable, QThreadPool, QTimer, Signal,
+    QAbstractTableModel, QModelIndex
+)
 from PySide6.QtGui import QAction, QIcon, QPainter, QPixmap, QColor, QKeySequence, QFont, QPen
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QDateEdit, QTextEdit, QTableWidget, QTableWidgetItem,
-    QAbstractItemView, QHeaderView, QMessageBox, QMenu, QStatusBar, QFrame, QLineEdit,
+    QDateEdit, QTextEdit, QTableView,
+    QAbstractItemView, QMessageBox, QMenu, QStatusBar, QFrame, QLineEdit,
     QStackedWidget, QCheckBox, QInputDialog, QFileDialog,
     QDialog, QDialogButtonBox, QDateTimeEdit
 )
 
-try:
-    from openpyxl import Workbook, load_workbook
-except ImportError:
+if importlib.util.find_spec("openpyxl") is None:  # imported on first use, off the startup path
     print("This tool requires 'openpyxl'. Install it with: pip install openpyxl", file=sys.stderr)
     sys.exit(1)
 
@@ -31,6 +35,12 @@ DATE_NUMBER_FORMAT = "yyyy-mm-dd"
 ACTIVITY_SHEET_NAME = "Activity"
 ACTIVITY_HEADERS = ("Ticket ID", "Start Time", "End Time")
 DATETIME_NUMBER_FORMAT = "yyyy-mm-dd hh:mm:ss"
+SAVE_DEBOUNCE_MS = 500
+STATUS_DEBOUNCE_MS = 50
+PREVIEW_DEBOUNCE_MS = 80
+FICLONE = 0x40049409
+ACTIVITY_FETCH_BATCH = 200
+TICKET_SEQ_RE = re.compile(r"(TH\d{6})(\d+)", re.ASCII)
 
 ACCENT = "#C62828"
 BG_LIGHT = "#FDF7F7"
@@ -93,9 +103,59 @@ def find_onedrive_dir() -> Path:
     return home
 
 
+def copy_file_win32(src: Path, dest: Path):
+    import ctypes
+    cancel = ctypes.c_int(0)
+    if not ctypes.windll.kernel32.CopyFileExW(str(src), str(dest), None, None, ctypes.byref(cancel), 0):
+        raise ctypes.WinError()
+
+
+def clone_file(src: Path, dest: Path) -> bool:
+    try:
+        if os.stat(src).st_dev != os.stat(dest.parent).st_dev:
+            return False
+        if sys.platform.startswith("linux"):
+            import fcntl
+            with open(src, "rb") as fs, open(dest, "wb") as fd:
+                fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+            return True
+        if sys.platform == "darwin":
+            import ctypes
+            libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+            return libc.clonefile(os.fsencode(src), os.fsencode(dest), 0) == 0
+    except OSError:
+        pass
+    return False
+
+
+def export_file(src: Path, dest: Path):
+    tmp = dest.with_suffix(dest.suffix + f".tmp.{os.getpid()}")
+    try:
+        if sys.platform == "win32":
+            copy_file_win32(src, tmp)  # keeps timestamps itself
+        else:
+            if not clone_file(src, tmp):
+                import shutil
+                shutil.copyfile(src, tmp)  # sendfile / fcopyfile
+            st = os.stat(src)
+            os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, dest)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def save_workbook_simple(wb, path: Path):
     try:
-        wb.save(path)
+        if path.exists():  # fail fast if Excel holds the file, before serializing
+            os.close(os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0)))
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp{path.suffix}")
+        try:
+            wb.save(tmp)
+            os.replace(tmp, path)  # a crash mid-save never leaves a truncated workbook
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
     except PermissionError:
         raise PermissionError(
             f"Cannot save the Excel file.\n\n"
@@ -104,47 +164,65 @@ def save_workbook_simple(wb, path: Path):
         )
 
 
+def write_sheet_values(ws, rows: list, width: int):
+    if not rows:
+        return
+    for cells, values in zip(ws.iter_rows(max_row=len(rows), max_col=width), rows):
+        for cell, value in zip(cells, values):
+            if cell.value == value:
+                continue
+            cell.value = value
+            if isinstance(value, datetime):
+                cell.number_format = DATETIME_NUMBER_FORMAT
+            elif isinstance(value, date):
+                cell.number_format = DATE_NUMBER_FORMAT
+
+
+def create_workbook(path: Path):
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_NAME)
+    ws.append(list(HEADERS))
+    ws_a = wb.create_sheet(ACTIVITY_SHEET_NAME)
+    ws_a.append(list(ACTIVITY_HEADERS))
+    save_workbook_simple(wb, path)
+
+
 def ensure_workbook_and_sheet(path: Path):
+    from openpyxl import load_workbook
     path.parent.mkdir(parents=True, exist_ok=True)
-    dirty = False
+    wb = None
     if path.exists():
         try:
             wb = load_workbook(path)
         except Exception:
-            wb = Workbook()
-            dirty = True
-    else:
-        wb = Workbook()
-        dirty = True
-        if "Sheet" in wb.sheetnames and len(wb.sheetnames) == 1:
-            wb.remove(wb["Sheet"])
+            wb = None
+    if wb is None:
+        create_workbook(path)
+        return load_workbook(path)
 
+    dirty = False
     if SHEET_NAME not in wb.sheetnames:
         ws = wb.create_sheet(title=SHEET_NAME)
-        ws["A1"], ws["B1"], ws["C1"], ws["D1"] = HEADERS
+        ws.append(list(HEADERS))
         dirty = True
     else:
         ws = wb[SHEET_NAME]
-        if ws.max_column < 4 or ws.cell(1, 2).value != "Updated On":
+        header = next(ws.iter_rows(min_row=1, max_row=1, max_col=4, values_only=True), (None,) * 4)
+        if header[1] != "Updated On":
             ws.insert_cols(2)
             ws["A1"], ws["B1"], ws["C1"], ws["D1"] = HEADERS
             dirty = True
-        if all(ws.cell(1, c).value is None for c in range(1, 5)):
-            ws["A1"], ws["B1"], ws["C1"], ws["D1"] = HEADERS
-            dirty = True
 
     if ACTIVITY_SHEET_NAME not in wb.sheetnames:
         ws_a = wb.create_sheet(title=ACTIVITY_SHEET_NAME)
-        ws_a["A1"] = ACTIVITY_HEADERS[0]
-        ws_a["B1"] = ACTIVITY_HEADERS[1]
-        ws_a["C1"] = ACTIVITY_HEADERS[2]
+        ws_a.append(list(ACTIVITY_HEADERS))
         dirty = True
     else:
         ws_a = wb[ACTIVITY_SHEET_NAME]
-        if ws_a["A1"].value is None and ws_a["B1"].value is None and ws_a["C1"].value is None:
-            ws_a["A1"] = ACTIVITY_HEADERS[0]
-            ws_a["B1"] = ACTIVITY_HEADERS[1]
-            ws_a["C1"] = ACTIVITY_HEADERS[2]
+        header_a = next(ws_a.iter_rows(min_row=1, max_row=1, max_col=3, values_only=True), (None,) * 3)
+        if all(v is None for v in header_a):
+            ws_a["A1"], ws_a["B1"], ws_a["C1"] = ACTIVITY_HEADERS
             dirty = True
 
     if dirty:
@@ -152,116 +230,374 @@ def ensure_workbook_and_sheet(path: Path):
     return wb
 
 
-def normalize_description(text: str) -> str:
-    if not text:
-        return ""
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    parts = [line.strip() for line in text.split("\n")]
-    parts = [p for p in parts if p]
-    return ", ".join(parts)
-
-
-def append_row(path: Path, d: date, ticket_id: str, desc: str):
-    wb = ensure_workbook_and_sheet(path)
-    ws = wb[SHEET_NAME]
-    now_dt = datetime.now()
-    ws.append([d, now_dt, ticket_id, desc])
-    last_row = ws.max_row
-    ws.cell(row=last_row, column=1).number_format = DATE_NUMBER_FORMAT
-    ws.cell(row=last_row, column=2).number_format = DATETIME_NUMBER_FORMAT
-    save_workbook_simple(wb, path)
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
-def latest_activity_time_map(path: Path) -> dict[str, datetime]:
-    result: dict[str, datetime] = {}
-    if not path.exists():
-        return result
-    wb = load_workbook(path, data_only=True)
-    if ACTIVITY_SHEET_NAME not in wb.sheetnames:
-        return result
-    ws = wb[ACTIVITY_SHEET_NAME]
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        t_id, start, end = (row + (None, None, None))[:3]
-        ticket = str(t_id or "").strip()
+def ticket_key(value) -> str:
+    return str(value or "").strip()
+
+
+def index_activity_sheet(ws) -> Tuple[dict[str, List[int]], dict[str, datetime]]:
+    open_rows: dict[str, List[int]] = {}
+    latest: dict[str, datetime] = {}
+    for row_idx, (a, b, c) in enumerate(ws.iter_rows(min_row=2, max_col=3, values_only=True), start=2):
+        ticket = ticket_key(a)
         if not ticket:
             continue
-        for dt_val in (start, end):
+        if c is None or (isinstance(c, str) and not c.strip()):
+            open_rows.setdefault(ticket, []).append(row_idx)
+        for dt_val in (b, c):
             if isinstance(dt_val, datetime):
-                prev = result.get(ticket)
+                prev = latest.get(ticket)
                 if prev is None or dt_val > prev:
-                    result[ticket] = dt_val
-    return result
+                    latest[ticket] = dt_val
+    return open_rows, latest
 
 
-def read_rows(path: Path) -> List[Tuple[str, str, str, str]]:
+class SaveSignals(QObject):
+    queued = Signal()
+    saved = Signal(str)
+    failed = Signal(str)
+
+
+class SaveTask(QRunnable):
+    def __init__(self, cache: "WorkbookCache", path: Path):
+        super().__init__()
+        self.cache = cache
+        self.path = path
+
+    def run(self):
+        signals = self.cache.signals
+        try:
+            self.cache.flush(self.path)
+        except Exception as e:
+            if signals is not None:
+                signals.failed.emit(str(e))
+            return
+        if signals is not None:
+            signals.saved.emit(str(self.path))
+
+
+class ExportSignals(QObject):
+    finished = Signal(str)
+    failed = Signal(str)
+
+
+class ExportTask(QRunnable):
+    def __init__(self, src: Path, dest: Path, signals: ExportSignals):
+        super().__init__()
+        self.src = src
+        self.dest = dest
+        self.signals = signals
+
+    def run(self):
+        try:
+            with WB_CACHE.file_lock:  # keep a background save from rewriting src mid-copy
+                export_file(self.src, self.dest)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(str(self.dest))
+
+
+class LoadSignals(QObject):
+    finished = Signal()
+    failed = Signal(str)
+
+
+class LoadTask(QRunnable):
+    def __init__(self, path: Path, signals: LoadSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        try:
+            read_incident_rows(self.path)  # warms the workbook cache and the row memo
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit()
+
+
+class WorkbookCache:
+    def __init__(self):
+        self.path: Optional[Path] = None
+        self.wb = None
+        self.signature: Optional[Tuple[int, int]] = None
+        self.open_activity_rows: dict[str, List[int]] = {}
+        self.activity_latest: dict[str, datetime] = {}
+        self.row_counts: dict[str, int] = {}
+        self.lock = threading.RLock()
+        self.file_lock = threading.Lock()  # only guards writes to the file, so exports don't block edits
+        self._save_copy = None  # (signature, workbook) matching the file on disk; saves patch this copy
+        self.dirty = False
+        self.save_queued = False
+        self.signals: Optional[SaveSignals] = None
+        self.generation = 0
+        self._edit_depth = 0
+
+    def get(self, path: Path):
+        with self.lock:
+            wb = self.peek(path)
+            if wb is not None:
+                return wb
+            self.wb = ensure_workbook_and_sheet(path)
+            self.path = path
+            self.signature = file_signature(path)
+            self.dirty = False
+            self.generation += 1
+            self.open_activity_rows, self.activity_latest = index_activity_sheet(self.wb[ACTIVITY_SHEET_NAME])
+            self.row_counts = {name: self.wb[name].max_row for name in (SHEET_NAME, ACTIVITY_SHEET_NAME)}
+            return self.wb
+
+    @contextmanager
+    def edit(self, path: Path) -> Iterator:
+        with self.lock:
+            wb = self.get(path)
+            had_pending = self.dirty
+            self._edit_depth += 1
+            try:
+                yield wb
+            except Exception:
+                if self._edit_depth == 1:
+                    if had_pending:  # keep earlier unsaved edits; reads must still see what this one touched
+                        self.generation += 1
+                    else:  # nothing unsaved: reloading from disk undoes just this edit
+                        self.invalidate()
+                raise
+            finally:
+                self._edit_depth -= 1
+            if self._edit_depth == 0:  # nested edits save once, at the outermost exit
+                self.generation += 1
+                self.save(path)
+
+    def add_row(self, sheet_name: str, values) -> int:
+        ws = self.wb[sheet_name]
+        row_idx = self.row_counts[sheet_name] + 1
+        for col, value in enumerate(values, start=1):
+            ws.cell(row=row_idx, column=col, value=value)
+        self.row_counts[sheet_name] = row_idx
+        return row_idx
+
+    def latest_open_activity_row(self, path: Path, ticket_id: str) -> int:
+        self.get(path)
+        rows = self.open_activity_rows.get(ticket_id)
+        return rows[-1] if rows else 0
+
+    def set_activity_row_open(self, ticket_id: str, row_idx: int, is_open: bool):
+        rows = self.open_activity_rows.setdefault(ticket_id, [])
+        if is_open and row_idx not in rows:
+            rows.append(row_idx)
+            rows.sort()
+        elif not is_open and row_idx in rows:
+            rows.remove(row_idx)
+        if not rows:
+            del self.open_activity_rows[ticket_id]
+
+    def record_activity_time(self, ticket_id: str, dt_val: datetime):
+        prev = self.activity_latest.get(ticket_id)
+        if prev is None or dt_val > prev:
+            self.activity_latest[ticket_id] = dt_val
+
+    def rename_activity_ticket(self, old_id: str, new_id: str):
+        for row_idx in self.open_activity_rows.pop(old_id, []):
+            self.set_activity_row_open(new_id, row_idx, True)
+        old_latest = self.activity_latest.pop(old_id, None)
+        if old_latest is not None:
+            self.record_activity_time(new_id, old_latest)
+
+    def save(self, path: Path):
+        self.dirty = True
+        if self.signals is None:
+            self.flush(path)  # on failure the edits stay dirty for the next save
+            return
+        self.signals.queued.emit()
+
+    def start_save(self, path: Path):
+        with self.lock:
+            if not self.dirty or self.save_queued:
+                return
+            self.save_queued = True
+        QThreadPool.globalInstance().start(SaveTask(self, path))
+
+    def flush(self, path: Path):
+        with self.file_lock:  # one save at a time, each from a snapshot taken after the previous one
+            with self.lock:
+                self.save_queued = False
+                if self.wb is None or not self.dirty:
+                    return
+                on_disk = file_signature(path)
+                if on_disk is not None and on_disk != self.signature:
+                    raise RuntimeError(
+                        f"The Excel file was changed outside the app after it was loaded:\n{path}\n\n"
+                        "Your recent changes were not written, so that newer version was not overwritten.\n"
+                        "Quit and discard them to load the newer file."
+                    )
+                if on_disk is None:  # nothing on disk to patch; write the cached workbook itself
+                    save_workbook_simple(self.wb, path)
+                    self.dirty = False
+                    self.signature = file_signature(path)
+                    return
+                generation = self.generation
+                snapshot = [
+                    (name, width, list(self.wb[name].iter_rows(
+                        max_row=self.row_counts[name], max_col=width, values_only=True)))
+                    for name, width in ((SHEET_NAME, len(HEADERS)), (ACTIVITY_SHEET_NAME, len(ACTIVITY_HEADERS)))
+                ]
+            # serialize outside the cache lock so edits and reads carry on during the save
+            copy_sig, wb = self._save_copy or (None, None)
+            self._save_copy = None
+            if wb is None or copy_sig != on_disk:
+                from openpyxl import load_workbook
+                wb = load_workbook(path)
+            for name, width, rows in snapshot:
+                ws = wb[name] if name in wb.sheetnames else wb.create_sheet(name)
+                write_sheet_values(ws, rows, width)
+            save_workbook_simple(wb, path)
+            signature = file_signature(path)
+            self._save_copy = (signature, wb)
+            with self.lock:
+                self.signature = signature
+                if self.generation == generation:  # edits made during the save stay dirty
+                    self.dirty = False
+
+    def peek(self, path: Path):
+        if self.wb is None or self.path != path:
+            return None
+        if self.signature == file_signature(path):
+            return self.wb
+        if self.dirty:  # newer file on disk but unsaved edits here: keep them, flush reports the conflict
+            return self.wb
+        return None
+
+    def invalidate(self):
+        with self.lock:
+            self.wb = None
+            self.signature = None
+            self.dirty = False
+            self.open_activity_rows = {}
+            self.activity_latest = {}
+            self.row_counts = {}
+
+
+WB_CACHE = WorkbookCache()
+
+
+@contextmanager
+def read_sheet(path: Path, sheet_name: str) -> Iterator:
+    with WB_CACHE.lock:
+        wb = WB_CACHE.get(path)
+        yield wb[sheet_name] if sheet_name in wb.sheetnames else None
+
+
+def normalize_description(text: str) -> str:
+    if not text:
+        return ""
+    return ", ".join(p for p in (line.strip() for line in text.splitlines()) if p)
+
+
+def append_row(path: Path, d: date, ticket_id: str, desc: str, updated_on: datetime) -> int:
+    with WB_CACHE.edit(path) as wb:
+        ws = wb[SHEET_NAME]
+        last_row = WB_CACHE.add_row(SHEET_NAME, (d, updated_on, ticket_id, desc))
+        ws.cell(row=last_row, column=1).number_format = DATE_NUMBER_FORMAT
+        ws.cell(row=last_row, column=2).number_format = DATETIME_NUMBER_FORMAT
+    return last_row
+
+
+def latest_activity_time_map(path: Path) -> dict[str, datetime]:
     if not path.exists():
-        return []
+        return {}
+    with WB_CACHE.lock:
+        WB_CACHE.get(path)
+        return dict(WB_CACHE.activity_latest)
+
+
+def as_datetime(x) -> Optional[datetime]:
+    if isinstance(x, datetime):
+        return x
+    if isinstance(x, date):
+        return datetime(x.year, x.month, x.day)
+    return None
+
+
+def format_datetime(x) -> str:
+    if isinstance(x, datetime):
+        return x.isoformat(" ", "seconds")
+    return str(x or "")
+
+
+@lru_cache(maxsize=1)
+def _read_incident_rows(path: Path, generation: int) -> List[Tuple[int, str, str, str, str]]:
     try:
-        wb = load_workbook(path, data_only=True)
+        with read_sheet(path, SHEET_NAME) as ws:
+            if ws is None:
+                return []
+            raw_rows = list(enumerate(ws.iter_rows(min_row=2, max_col=4, values_only=True), start=2))
     except Exception:
         return []
-    if SHEET_NAME not in wb.sheetnames:
-        return []
     activity_latest = latest_activity_time_map(path)
-    ws = wb[SHEET_NAME]
-    rows: List[Tuple[str, str, str, str]] = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        created_on, updated_on, ticket_id, description = (row + (None, None, None, None))[:4]
+    rows: List[Tuple[int, str, str, str, str]] = []
+    for excel_row, (created_on, updated_on, ticket_id, description) in raw_rows:
         if created_on is None and ticket_id is None and description is None:
             continue
-        ticket_id_str = str(ticket_id or "").strip()
-
-        def to_dt(x):
-            if isinstance(x, datetime):
-                return x
-            if isinstance(x, date):
-                return datetime.combine(x, datetime.min.time())
-            return None
+        ticket_id_str = ticket_key(ticket_id)
 
-        latest_dt = to_dt(updated_on) or to_dt(created_on)
+        latest_dt = as_datetime(updated_on) or as_datetime(created_on)
         act_dt = activity_latest.get(ticket_id_str)
         if act_dt and (latest_dt is None or act_dt > latest_dt):
             latest_dt = act_dt
 
-        def fmt_created(x):
-            if isinstance(x, datetime):
-                return x.strftime("%Y-%m-%d")
-            if isinstance(x, date):
-                return x.strftime("%Y-%m-%d")
-            return str(x or "")
-
-        def fmt_updated(dt_val):
-            if isinstance(dt_val, datetime):
-                return dt_val.strftime("%Y-%m-%d %H:%M:%S")
-            return ""
+        if isinstance(created_on, datetime):
+            created_str = created_on.date().isoformat()
+        elif isinstance(created_on, date):
+            created_str = created_on.isoformat()
+        else:
+            created_str = str(created_on or "")
 
         rows.append((
-            fmt_created(created_on),
-            fmt_updated(latest_dt) if latest_dt else "",
+            excel_row,
+            created_str,
+            latest_dt.isoformat(" ", "seconds") if latest_dt else "",
             ticket_id_str,
             description or ""
         ))
     return rows
 
 
-def next_default_ticket_for_date(path: Path, d: date) -> str:
+def read_incident_rows(path: Path) -> List[Tuple[int, str, str, str, str]]:
+    WB_CACHE.get(path)
+    return _read_incident_rows(path, WB_CACHE.generation)
+
+
+def read_rows(path: Path) -> List[Tuple[str, str, str, str]]:
+    if not path.exists():
+        return []
+    return [row[1:] for row in read_incident_rows(path)]
+
+
+def ticket_prefix_for_date(d: date) -> str:
     yy = d.year % 100
-    prefix = f"TH{yy:02d}{d.month:02d}{d.day:02d}"
-    max_seq = 0
-    try:
-        if path.exists():
-            wb = load_workbook(path, data_only=True)
-            if SHEET_NAME in wb.sheetnames:
-                ws = wb[SHEET_NAME]
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    ticket_id = (row[2] or "").strip()
-                    if ticket_id.startswith(prefix):
-                        tail = ticket_id[len(prefix):]
-                        if tail.isdigit():
-                            max_seq = max(max_seq, int(tail))
-    except Exception:
-        pass
-    return f"{prefix}{max_seq + 1:02d}"
+    return f"TH{yy:02d}{d.month:02d}{d.day:02d}"
+
+
+def record_ticket_seq(seq_by_prefix: dict[str, int], ticket_id: str):
+    m = TICKET_SEQ_RE.fullmatch(ticket_id)
+    if m:
+        prefix, seq = m.group(1), int(m.group(2))
+        if seq > seq_by_prefix.get(prefix, 0):
+            seq_by_prefix[prefix] = seq
+
+
+def next_default_ticket_for_date(seq_by_prefix: dict[str, int], d: date) -> str:
+    prefix = ticket_prefix_for_date(d)
+    return f"{prefix}{seq_by_prefix.get(prefix, 0) + 1:02d}"
 
 
 def emoji_icon(emoji: str, size: int = 128,
@@ -279,6 +615,7 @@ def emoji_icon(emoji: str, size: int = 128,
     return QIcon(pm)
 
 
+@lru_cache(maxsize=None)
 def load_window_icon() -> QIcon:
     for name in ("app.ico", "app.png", "app.icns"):
         p = app_dir() / name
@@ -320,128 +657,130 @@ def sort_az_pixmap(size: int = 20, fg=QColor(45, 20, 20)) -> QPixmap:
     return pm
 
 
-def append_activity_start(path: Path, ticket_id: str, start_dt: datetime):
-    wb = ensure_workbook_and_sheet(path)
-    ws = wb[ACTIVITY_SHEET_NAME]
-    ws.append([ticket_id, start_dt, None])
-    last_row = ws.max_row
-    ws.cell(row=last_row, column=2).number_format = DATETIME_NUMBER_FORMAT
-    save_workbook_simple(wb, path)
+@lru_cache(maxsize=None)
+def latest_first_pixmap(checked: bool) -> QPixmap:
+    colour = QColor(46, 125, 50) if checked else QColor(122, 122, 122)
+    return sort_az_pixmap(20, fg=colour)
 
 
-def find_latest_open_activity_row(ws, ticket_id: str) -> int:
-    for row_idx in range(ws.max_row, 1, -1):
-        a = ws.cell(row=row_idx, column=1).value
-        c = ws.cell(row=row_idx, column=3).value
-        a_str = str(a or "").strip()
-        c_empty = c is None or (isinstance(c, str) and not c.strip())
-        if a_str == ticket_id and c_empty:
-            return row_idx
-    return 0
+def append_activity_start(path: Path, ticket_id: str, start_dt: datetime) -> int:
+    with WB_CACHE.edit(path) as wb:
+        ws = wb[ACTIVITY_SHEET_NAME]
+        last_row = WB_CACHE.add_row(ACTIVITY_SHEET_NAME, (ticket_id, start_dt, None))
+        ws.cell(row=last_row, column=2).number_format = DATETIME_NUMBER_FORMAT
+        WB_CACHE.set_activity_row_open(ticket_id, last_row, True)
+        WB_CACHE.record_activity_time(ticket_id, start_dt)
+    return last_row
 
 
-def set_activity_end(path: Path, ticket_id: str, end_dt: datetime) -> bool:
-    wb = ensure_workbook_and_sheet(path)
-    ws = wb[ACTIVITY_SHEET_NAME]
-    row_idx = find_latest_open_activity_row(ws, ticket_id)
+def set_activity_end(path: Path, ticket_id: str, end_dt: datetime) -> int:
+    row_idx = WB_CACHE.latest_open_activity_row(path, ticket_id)
     if row_idx == 0:
-        return False
-    ws.cell(row=row_idx, column=3, value=end_dt)
-    ws.cell(row=row_idx, column=3).number_format = DATETIME_NUMBER_FORMAT
-    save_workbook_simple(wb, path)
-    return True
+        return 0
+    with WB_CACHE.edit(path) as wb:
+        ws = wb[ACTIVITY_SHEET_NAME]
+        end_cell = ws.cell(row=row_idx, column=3, value=end_dt)
+        end_cell.number_format = DATETIME_NUMBER_FORMAT
+        WB_CACHE.set_activity_row_open(ticket_id, row_idx, False)
+        WB_CACHE.record_activity_time(ticket_id, end_dt)
+    return row_idx
 
 
 def has_open_activity(path: Path, ticket_id: str) -> bool:
     if not path.exists():
         return False
-    wb = load_workbook(path)
-    if ACTIVITY_SHEET_NAME not in wb.sheetnames:
-        return False
-    ws = wb[ACTIVITY_SHEET_NAME]
-    return find_latest_open_activity_row(ws, ticket_id) > 0
+    return WB_CACHE.latest_open_activity_row(path, ticket_id) > 0
+
+
+@lru_cache(maxsize=1)
+def _activity_rows_by_ticket(path: Path, generation: int) -> dict[str, List[tuple]]:
+    index: dict[str, List[tuple]] = {}
+    with read_sheet(path, ACTIVITY_SHEET_NAME) as ws:
+        if ws is None:
+            return index
+        for r_idx, row in enumerate(ws.iter_rows(min_row=2, max_col=3, values_only=True), start=2):
+            t_id, start, end = row
+            ticket = ticket_key(t_id)
+            if not ticket:
+                continue
+            index.setdefault(ticket, []).append((r_idx, start, end))
+    return index
+
+
+def refresh_activity_latest(path: Path, ticket_id: str):
+    ticket_id = ticket_key(ticket_id)
+    with WB_CACHE.lock:
+        WB_CACHE.get(path)
+        WB_CACHE.activity_latest.pop(ticket_id, None)
+        for _r, start, end in _activity_rows_by_ticket(path, WB_CACHE.generation).get(ticket_id, []):
+            for dt_val in (start, end):
+                if isinstance(dt_val, datetime):
+                    WB_CACHE.record_activity_time(ticket_id, dt_val)
 
 
 def read_activity_rows_for_ticket(path: Path, ticket_id: str) -> List[Tuple[int, str, str, str]]:
     if not path.exists():
         return []
-    wb = load_workbook(path, data_only=True)
-    if ACTIVITY_SHEET_NAME not in wb.sheetnames:
-        return []
-    ws = wb[ACTIVITY_SHEET_NAME]
+    WB_CACHE.get(path)
+    raw_rows = _activity_rows_by_ticket(path, WB_CACHE.generation).get(ticket_id, [])
     rows: List[Tuple[int, datetime, str, str]] = []
-    for r_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-        t_id, start, end = (row + (None, None, None))[:3]
-        if str(t_id or "").strip() != ticket_id:
-            continue
-
-        def fmt_dt(x):
-            if isinstance(x, datetime):
-                return x.strftime("%Y-%m-%d %H:%M:%S")
-            return str(x or "")
-
-        rows.append((r_idx, start if isinstance(start, datetime) else datetime.min, fmt_dt(start), fmt_dt(end)))
+    for r_idx, start, end in raw_rows:
+        rows.append((r_idx, start if isinstance(start, datetime) else datetime.min,
+                     format_datetime(start), format_datetime(end)))
     rows.sort(key=lambda r: r[1])
     return [(r[0], ticket_id, r[2], r[3]) for r in rows]
 
 
-def update_ticket_id_in_incidents_by_row(path: Path, excel_row_idx: int, new_ticket_id: str):
-    wb = ensure_workbook_and_sheet(path)
-    ws = wb[SHEET_NAME]
-    ws.cell(row=excel_row_idx, column=3, value=new_ticket_id)
-    now_dt = datetime.now()
-    ws.cell(row=excel_row_idx, column=2, value=now_dt)
-    ws.cell(row=excel_row_idx, column=2).number_format = DATETIME_NUMBER_FORMAT
-    save_workbook_simple(wb, path)
-
-
-def rename_ticket_id_in_activity(path: Path, old_id: str, new_id: str) -> int:
-    wb = ensure_workbook_and_sheet(path)
-    ws = wb[ACTIVITY_SHEET_NAME]
+def rename_ticket_id_everywhere(path: Path, excel_row_idx: int, old_id: str, new_id: str,
+                                updated_on: datetime, rename_activity: bool) -> int:
     changed = 0
-    for r in range(2, ws.max_row + 1):
-        a = ws.cell(row=r, column=1).value
-        if str(a or "").strip() == old_id:
-            ws.cell(row=r, column=1, value=new_id)
-            changed += 1
-    save_workbook_simple(wb, path)
+    with WB_CACHE.edit(path) as wb:
+        ws = wb[SHEET_NAME]
+        ws.cell(row=excel_row_idx, column=3, value=new_id)
+        updated = ws.cell(row=excel_row_idx, column=2, value=updated_on)
+        updated.number_format = DATETIME_NUMBER_FORMAT
+        if rename_activity:
+            ws_a = wb[ACTIVITY_SHEET_NAME]
+            for r, _start, _end in _activity_rows_by_ticket(path, WB_CACHE.generation).get(old_id, []):
+                ws_a.cell(row=r, column=1, value=new_id)
+                changed += 1
+            WB_CACHE.rename_activity_ticket(old_id, new_id)
     return changed
 
 
+@lru_cache(maxsize=1)
+def _incident_rows_by_ticket(path: Path, generation: int) -> dict[str, List[int]]:
+    index: dict[str, List[int]] = {}
+    for excel_row, _created, _updated, ticket_id, _desc in _read_incident_rows(path, generation):
+        index.setdefault(ticket_id, []).append(excel_row)
+    return index
+
+
 def any_activity_for_ticket(path: Path, ticket_id: str) -> bool:
     if not path.exists():
         return False
-    wb = load_workbook(path, data_only=True)
-    if ACTIVITY_SHEET_NAME not in wb.sheetnames:
-        return False
-    ws = wb[ACTIVITY_SHEET_NAME]
-    for r in range(2, ws.max_row + 1):
-        a = ws.cell(row=r, column=1).value
-        if str(a or "").strip() == ticket_id:
-            return True
-    return False
+    WB_CACHE.get(path)
+    return ticket_id in _activity_rows_by_ticket(path, WB_CACHE.generation)
 
 
 def ticket_id_exists_elsewhere(path: Path, new_id: str, exclude_row: int) -> bool:
     if not path.exists():
         return False
-    wb = load_workbook(path, data_only=True)
-    if SHEET_NAME not in wb.sheetnames:
-        return False
-    ws = wb[SHEET_NAME]
-    for r in range(2, ws.max_row + 1):
-        if r == exclude_row:
-            continue
-        val = ws.cell(row=r, column=3).value
-        if str(val or "").strip() == new_id:
-            return True
-    return False
+    WB_CACHE.get(path)
+    rows = _incident_rows_by_ticket(path, WB_CACHE.generation).get(new_id, ())
+    return any(r != exclude_row for r in rows)
 
 
+@lru_cache(maxsize=256)
 def parse_dt_str(s: str) -> Optional[datetime]:
     s = s.strip()
     if not s:
         return None
+    if s[4:5] == s[7:8] == "-" and (len(s) == 10 or (len(s) == 19 and s[10] == " ")):
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
         try:
             return datetime.strptime(s, fmt)
@@ -451,14 +790,141 @@ def parse_dt_str(s: str) -> Optional[datetime]:
 
 
 def update_incident_updated_on_for_ticket(path: Path, ticket_id: str, dt_val: datetime):
-    wb = ensure_workbook_and_sheet(path)
-    ws = wb[SHEET_NAME]
-    for r in range(2, ws.max_row + 1):
-        val = ws.cell(row=r, column=3).value
-        if str(val or "").strip() == ticket_id:
-            ws.cell(row=r, column=2, value=dt_val)
-            ws.cell(row=r, column=2).number_format = DATETIME_NUMBER_FORMAT
-    save_workbook_simple(wb, path)
+    with WB_CACHE.edit(path) as wb:
+        ws = wb[SHEET_NAME]
+        for r, (val,) in enumerate(ws.iter_rows(min_row=2, min_col=3, max_col=3, values_only=True), start=2):
+            if ticket_key(val) == ticket_id:
+                updated = ws.cell(row=r, column=2, value=dt_val)
+                updated.number_format = DATETIME_NUMBER_FORMAT
+
+
+class RowTableModel(QAbstractTableModel):
+    def __init__(self, headers, parent=None, batch_size: int = 0, key_column: Optional[int] = None):
+        super().__init__(parent)
+        self.headers = tuple(headers)
+        self.rows: list = []  # (excel_row, *column texts)
+        self._row_of: dict[int, int] = {}
+        self.key_column = key_column
+        self._rows_by_key: dict[str, List[int]] = {}
+        self.batch_size = batch_size  # 0 = show every row at once
+        self._loaded = 0
+
+    def _reindex(self):
+        self._row_of = {row[0]: r for r, row in enumerate(self.rows)}
+        self._rows_by_key = {}
+        if self.key_column is not None:
+            k = self.key_column + 1
+            for r, row in enumerate(self.rows):
+                self._rows_by_key.setdefault(row[k], []).append(r)
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = list(rows)
+        self._reindex()
+        self._loaded = min(len(self.rows), self.batch_size) if self.batch_size else len(self.rows)
+        self.endResetModel()
+
+    def update_rows(self, rows):
+        rows = list(rows)
+        n = len(self.rows)
+        if len(rows) < n or any(row[0] not in self._row_of for row in rows[:n]):
+            self.set_rows(rows)
+            return
+        changed = []
+        for row in rows[:n]:
+            r = self._row_of[row[0]]
+            if self.rows[r] != row:
+                self.rows[r] = row
+                changed.append(r)
+        if changed:
+            self._reindex()
+            changed = [r for r in changed if r < self._loaded]
+        if changed:
+            self.dataChanged.emit(self.index(min(changed), 0),
+                                  self.index(max(changed), len(self.headers) - 1), [Qt.DisplayRole])
+        for row in rows[n:]:
+            self.append_row(row)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self.rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        n = min(self.batch_size or len(self.rows), len(self.rows) - self._loaded)
+        if n <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + n - 1)
+        self._loaded += n
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.rows[index.row()][index.column() + 1]
+        if role == Qt.UserRole:
+            return self.rows[index.row()][0]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        order_idx = sorted(range(len(self.rows)), key=lambda i: self.rows[i][column + 1],
+                           reverse=order == Qt.DescendingOrder)
+        self.rows = [self.rows[i] for i in order_idx]
+        self._reindex()
+        new_pos = {old: new for new, old in enumerate(order_idx)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_pos[i.row()], i.column()) for i in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+    def find_row(self, excel_row: int) -> int:
+        return self._row_of.get(excel_row, -1)
+
+    def find_rows_by_key(self, key: str) -> List[int]:
+        return self._rows_by_key.get(key, [])
+
+    def append_row(self, row: tuple):
+        r = len(self.rows)
+        self._row_of[row[0]] = r
+        if self.key_column is not None:
+            self._rows_by_key.setdefault(row[self.key_column + 1], []).append(r)
+        if self._loaded < r:
+            self.rows.append(row)  # shown once fetchMore reaches it
+            return
+        self.beginInsertRows(QModelIndex(), r, r)
+        self.rows.append(row)
+        self._loaded += 1
+        self.endInsertRows()
+
+    def set_cell(self, row: int, column: int, text: str):
+        values = list(self.rows[row])
+        values[column + 1] = text
+        self.rows[row] = tuple(values)
+        if column == self.key_column:
+            self._reindex()
+        if row < self._loaded:
+            idx = self.index(row, column)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def excel_row(self, row: int) -> Optional[int]:
+        return self.rows[row][0] if 0 <= row < len(self.rows) else None
+
+    def text(self, row: int, column: int) -> str:
+        return self.rows[row][column + 1] if 0 <= row < len(self.rows) else ""
 
 
 class EditActivityDialog(QDialog):
@@ -501,10 +967,11 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(980, 700)
         self.setWindowIcon(load_window_icon())
 
-        ensure_workbook_and_sheet(EXCEL_PATH)
-
         self._user_edited_ticket = False
         self._activity_ticket_id: str = ""
+        self._seq_by_prefix: dict[str, int] = {}
+        self._last_norm_in: Optional[str] = None
+        self._last_norm_out = ""
         self.latest_first: bool = False
 
         central = QWidget()
@@ -526,15 +993,55 @@ class MainWindow(QMainWindow):
 
         self.status = QStatusBar()
         self.setStatusBar(self.status)
+        self._pending_status = ""
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_DEBOUNCE_MS)
+        self._status_timer.timeout.connect(lambda: self.status.showMessage(self._pending_status))
+        self.save_label = QLabel("Saved")
+        self.status.addPermanentWidget(self.save_label)
         self.update_status(f"File: {EXCEL_PATH}")
 
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._flush_timer.timeout.connect(lambda: WB_CACHE.start_save(EXCEL_PATH))
+
+        self.save_signals = SaveSignals(self)
+        self.save_signals.queued.connect(self.on_save_queued)
+        self.save_signals.saved.connect(self.on_save_done)
+        self.save_signals.failed.connect(self.on_save_failed)
+        WB_CACHE.signals = self.save_signals
+
+        self.export_signals = ExportSignals(self)
+        self.export_signals.finished.connect(self.on_export_done)
+        self.export_signals.failed.connect(self.on_export_failed)
+
+        self.load_signals = LoadSignals(self)
+        self.load_signals.finished.connect(self.on_initial_load_done)
+        self.load_signals.failed.connect(self.on_initial_load_failed)
+
         self._add_shortcuts()
 
-        self.fill_default_ticket()
-        self.load_table()
         self.update_preview()
 
         self._apply_styles()
+        self.update_status(f"Loading {EXCEL_PATH}…")
+        self._set_workbook_actions_enabled(False)  # until the cache has loaded
+        QThreadPool.globalInstance().start(LoadTask(EXCEL_PATH, self.load_signals))
+
+    def on_initial_load_done(self):
+        self.load_table()
+        self._fit_columns(self.table)
+        if not self._user_edited_ticket:
+            self.fill_default_ticket()
+        self._set_workbook_actions_enabled(True)
+
+    def on_initial_load_failed(self, msg: str):
+        QMessageBox.critical(self, "Error", f"Failed to read Excel:\n{msg}")
+        if not self._user_edited_ticket:
+            self.fill_default_ticket()
+        self._set_workbook_actions_enabled(True)
 
     def _build_main_page(self, page: QWidget):
         root = QVBoxLayout(page)
@@ -585,7 +1092,11 @@ class MainWindow(QMainWindow):
         lbl_desc = QLabel("Description (multi-line allowed)")
         self.desc_text = QTextEdit()
         self.desc_text.setPlaceholderText("Enter incident description; multiple lines will be joined with commas")
-        self.desc_text.textChanged.connect(self.update_preview)
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self.update_preview)
+        self.desc_text.textChanged.connect(self._preview_timer.start)
         desc_frame.addWidget(lbl_desc)
         desc_frame.addWidget(self.desc_text)
         root.addLayout(desc_frame)
@@ -639,7 +1150,8 @@ class MainWindow(QMainWindow):
         self.lbl_latest_icon.setCursor(Qt.PointingHandCursor)
 
         def _toggle_checkbox(_event):
-            self.chk_latest_first.toggle()
+            if self.chk_latest_first.isEnabled():
+                self.chk_latest_first.toggle()
         self.lbl_latest_icon.mousePressEvent = _toggle_checkbox  # type: ignore
 
         self.btn_view_activity = QPushButton("View Activity")
@@ -662,18 +1174,21 @@ class MainWindow(QMainWindow):
         btn_row.addWidget(tip)
         root.addLayout(btn_row)
 
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.model = RowTableModel(HEADERS, self, key_column=2)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.on_table_context_menu)
-        self.table.itemDoubleClicked.connect(self.on_table_double_clicked)
+        self._table_menu = QMenu(self)
+        self._table_menu.addAction("Copy row", self.copy_selected_row)
+        self._table_menu.addAction("View Activity", self.open_activity_for_selection)
+        self._table_menu.addSeparator()
+        self._table_menu.addAction("Update Ticket ID...", self.on_update_ticket_id)
+        self.table.doubleClicked.connect(self.on_table_double_clicked)
         root.addWidget(self.table)
 
         self._update_latest_icon(self.chk_latest_first.isChecked())
@@ -716,17 +1231,18 @@ class MainWindow(QMainWindow):
         self.act_info.setStyleSheet("color:#8A5555;")
         root.addWidget(self.act_info)
 
-        self.act_table = QTableWidget(0, 3)
-        self.act_table.setHorizontalHeaderLabels(ACTIVITY_HEADERS)
+        self.act_model = RowTableModel(ACTIVITY_HEADERS, self, batch_size=ACTIVITY_FETCH_BATCH)
+        self.act_table = QTableView()
+        self.act_table.setModel(self.act_model)
         self.act_table.setAlternatingRowColors(True)
         self.act_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.act_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.act_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.act_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.act_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self.act_table.horizontalHeader().setStretchLastSection(True)
         self.act_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.act_table.customContextMenuRequested.connect(self.on_activity_context_menu)
-        self.act_table.itemDoubleClicked.connect(lambda _: self.on_edit_activity_time())
+        self._act_menu = QMenu(self)
+        self._act_menu.addAction("Edit record time...", self.on_edit_activity_time)
+        self.act_table.doubleClicked.connect(lambda _: self.on_edit_activity_time())
         root.addWidget(self.act_table)
 
         tip = QLabel("Tip: Use Ctrl+Shift+S to Start and Ctrl+E to Stop while on this view. Double-click an activity row to edit times.")
@@ -737,7 +1253,7 @@ class MainWindow(QMainWindow):
         self.setStyleSheet(f"""
             QWidget {{ background: {BG_LIGHT}; color: {TEXT_PRIMARY}; }}
             QTextEdit {{ background: white; border: 1px solid #E6BFBF; }}
-            QTableWidget {{ background: white; alternate-background-color: {ROW_ALT}; }}
+            QTableView {{ background: white; alternate-background-color: {ROW_ALT}; }}
             QPushButton {{ padding: 6px 10px; }}
         """)
 
@@ -747,27 +1263,50 @@ class MainWindow(QMainWindow):
             act.setShortcut(QKeySequence(seq))
             act.triggered.connect(handler)
             self.addAction(act)
-
-        add_seq("Ctrl+Return", self.on_add)
-        add_seq("Ctrl+Enter", self.on_add)
+            return act
+
+        self._workbook_actions = [
+            add_seq("Ctrl+Return", self.on_add),
+            add_seq("Ctrl+Enter", self.on_add),
+            add_seq("Ctrl+O", self.open_excel),
+            add_seq("F5", self.load_table),
+            add_seq("Ctrl+Shift+S", self.on_start_activity),
+            add_seq("Ctrl+E", self.on_stop_activity),
+        ]
         add_seq("Ctrl+L", self.on_clear)
         add_seq("Ctrl+T", self.set_today)
-        add_seq("Ctrl+O", self.open_excel)
-        add_seq("F5", self.load_table)
-        add_seq("Ctrl+Shift+S", self.on_start_activity)
-        add_seq("Ctrl+E", self.on_stop_activity)
+
+    def _set_workbook_actions_enabled(self, enabled: bool):
+        for w in (
+            self.btn_add, self.btn_update, self.btn_open, self.btn_export, self.btn_refresh,
+            self.btn_view_activity, self.chk_latest_first,
+            self.act_btn_start, self.act_btn_stop, self.act_btn_refresh, self.act_btn_edit,
+            *self._workbook_actions,
+        ):
+            w.setEnabled(enabled)
 
     def _update_latest_icon(self, checked: bool):
-        colour = QColor(46, 125, 50) if checked else QColor(122, 122, 122)
-        self.lbl_latest_icon.setPixmap(sort_az_pixmap(20, fg=colour))
+        self.lbl_latest_icon.setPixmap(latest_first_pixmap(checked))
 
     def _select_row_by_excel_row(self, excel_row_idx: int):
-        for r in range(self.table.rowCount()):
-            item = self.table.item(r, 0)
-            if item and item.data(Qt.UserRole) == excel_row_idx:
-                self.table.selectRow(r)
-                self.table.scrollToItem(item, QAbstractItemView.PositionAtCenter)
-                break
+        r = self.model.find_row(excel_row_idx)
+        if r >= 0:
+            self.table.selectRow(r)
+            self.table.scrollTo(self.model.index(r, 0), QAbstractItemView.PositionAtCenter)
+
+    def _touch_incident_rows(self, ticket_id: str, text: str):
+        for r in self.model.find_rows_by_key(ticket_id):
+            self.model.set_cell(r, 1, text)
+
+    @staticmethod
+    def _fit_columns(view: QTableView):
+        for col in range(view.model().columnCount() - 1):  # last section stretches
+            view.resizeColumnToContents(col)
+
+    @staticmethod
+    def _current_row(view: QTableView) -> int:
+        idx = view.currentIndex()
+        return idx.row() if idx.isValid() else -1
 
     def set_today(self):
         self.date_edit.setDate(QDate.currentDate())
@@ -782,7 +1321,7 @@ class MainWindow(QMainWindow):
     def fill_default_ticket(self):
         dqt = self.date_edit.date()
         d_py = date(dqt.year(), dqt.month(), dqt.day())
-        suggested = next_default_ticket_for_date(EXCEL_PATH, d_py)
+        suggested = next_default_ticket_for_date(self._seq_by_prefix, d_py)
         self.ticket_edit.setText(suggested)
         self._user_edited_ticket = False
 
@@ -796,31 +1335,44 @@ class MainWindow(QMainWindow):
 
         ticket_id = self.ticket_edit.text().strip()
         if not ticket_id:
-            ticket_id = next_default_ticket_for_date(EXCEL_PATH, d_py)
+            ticket_id = next_default_ticket_for_date(self._seq_by_prefix, d_py)
 
-        desc = normalize_description(self.desc_text.toPlainText())
+        desc = self._normalized_description()
         if not desc:
             QMessageBox.critical(self, "Missing description", "Please enter the Description.")
             return
 
+        now = datetime.now()
         try:
-            append_row(EXCEL_PATH, d_py, ticket_id, desc)
+            excel_row = append_row(EXCEL_PATH, d_py, ticket_id, desc, now)
         except PermissionError as e:
             QMessageBox.critical(self, "Cannot save", str(e))
             return
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add entry:\n{e}")
             return
+        record_ticket_seq(self._seq_by_prefix, ticket_id)
 
         self.update_status(f"Added: {d_py.strftime('%Y-%m-%d')} • {ticket_id}")
 
         self.on_clear()
         self.fill_default_ticket()
-        self.load_table()
+
+        # show the new row without re-reading the sheet
+        act_dt = latest_activity_time_map(EXCEL_PATH).get(ticket_id)
+        latest_dt = act_dt if act_dt and act_dt > now else now
+        self.model.append_row((excel_row, d_py.isoformat(), format_datetime(latest_dt), ticket_id, desc))
+        if self.latest_first:
+            self.table.sortByColumn(0, Qt.DescendingOrder)
+
+    def _normalized_description(self) -> str:
+        text = self.desc_text.toPlainText()
+        if text != self._last_norm_in:
+            self._last_norm_in, self._last_norm_out = text, normalize_description(text)
+        return self._last_norm_out
 
     def update_preview(self):
-        text = self.desc_text.toPlainText().strip()
-        combined = normalize_description(text)
+        combined = self._normalized_description()
         self.preview.setText(combined or "(nothing yet)")
 
     def on_toggle_latest_first(self, checked: bool):
@@ -831,77 +1383,23 @@ class MainWindow(QMainWindow):
             self.table.sortByColumn(0, Qt.DescendingOrder)
         else:
             self.table.setSortingEnabled(False)
+            self.model.sort(-1)  # back to Excel row order
             self.load_table()
 
     def load_table(self):
         try:
-            ensure_workbook_and_sheet(EXCEL_PATH)
-            activity_latest = latest_activity_time_map(EXCEL_PATH)
-            wb = load_workbook(EXCEL_PATH, data_only=True)
-            if SHEET_NAME not in wb.sheetnames:
-                rows = []
-            else:
-                ws = wb[SHEET_NAME]
-                rows = []
-                for excel_row in range(2, ws.max_row + 1):
-                    created_on = ws.cell(row=excel_row, column=1).value
-                    updated_on = ws.cell(row=excel_row, column=2).value
-                    ticket_id_val = ws.cell(row=excel_row, column=3).value
-                    description = ws.cell(row=excel_row, column=4).value
-                    if created_on is None and ticket_id_val is None and description is None:
-                        continue
-                    ticket_id = str(ticket_id_val or "").strip()
-
-                    def to_dt(x):
-                        if isinstance(x, datetime):
-                            return x
-                        if isinstance(x, date):
-                            return datetime.combine(x, datetime.min.time())
-                        return None
-
-                    latest_dt = to_dt(updated_on) or to_dt(created_on)
-                    act_dt = activity_latest.get(ticket_id)
-                    if act_dt and (latest_dt is None or act_dt > latest_dt):
-                        latest_dt = act_dt
-
-                    def fmt_created(x):
-                        if isinstance(x, datetime):
-                            return x.strftime("%Y-%m-%d")
-                        if isinstance(x, date):
-                            return x.strftime("%Y-%m-%d")
-                        return str(x or "")
-
-                    def fmt_updated(dt_val):
-                        if isinstance(dt_val, datetime):
-                            return dt_val.strftime("%Y-%m-%d %H:%M:%S")
-                        return ""
-
-                    rows.append((
-                        excel_row,
-                        fmt_created(created_on),
-                        fmt_updated(latest_dt) if latest_dt else "",
-                        ticket_id,
-                        description or ""
-                    ))
+            rows = read_incident_rows(EXCEL_PATH)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to read Excel:\n{e}")
             return
 
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(0)
-        for excel_row, d_created, d_updated, ticket, desc in rows:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            items = [
-                QTableWidgetItem(d_created),
-                QTableWidgetItem(d_updated),
-                QTableWidgetItem(ticket),
-                QTableWidgetItem(desc),
-            ]
-            for c, it in enumerate(items):
-                it.setData(Qt.UserRole, excel_row)
-                self.table.setItem(r, c, it)
+        seq_by_prefix: dict[str, int] = {}
+        for row in rows:
+            record_ticket_seq(seq_by_prefix, row[3])
+        self._seq_by_prefix = seq_by_prefix
 
+        self.table.setSortingEnabled(False)
+        self.model.update_rows(rows)
         if self.latest_first:
             self.table.setSortingEnabled(True)
             self.table.sortByColumn(0, Qt.DescendingOrder)
@@ -913,60 +1411,38 @@ class MainWindow(QMainWindow):
         if not idx.isValid():
             return
         self.table.selectRow(idx.row())
-        menu = QMenu(self)
-        act_copy = QAction("Copy row", self)
-        act_copy.triggered.connect(self.copy_selected_row)
-        act_open = QAction("View Activity", self)
-        act_open.triggered.connect(self.open_activity_for_selection)
-        act_update = QAction("Update Ticket ID...", self)
-        act_update.triggered.connect(self.on_update_ticket_id)
-        menu.addAction(act_copy)
-        menu.addAction(act_open)
-        menu.addSeparator()
-        menu.addAction(act_update)
-        menu.exec(self.table.viewport().mapToGlobal(pos))
+        self._table_menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def copy_selected_row(self):
-        row = self.table.currentRow()
+        row = self._current_row(self.table)
         if row < 0:
             return
-        d = self.table.item(row, 0).text() if self.table.item(row, 0) else ""
-        u = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-        t = self.table.item(row, 2).text() if self.table.item(row, 2) else ""
-        desc = self.table.item(row, 3).text() if self.table.item(row, 3) else ""
-        text = f"{d}\t{u}\t{t}\t{desc}"
+        text = "\t".join(self.model.text(row, c) for c in range(len(HEADERS)))
         QApplication.clipboard().setText(text)
         self.update_status("Row copied to clipboard.")
 
-    def on_table_double_clicked(self, item: QTableWidgetItem):
+    def on_table_double_clicked(self, index: QModelIndex):
         self.open_activity_for_selection()
 
     def open_activity_for_selection(self):
-        row = self.table.currentRow()
+        row = self._current_row(self.table)
         if row < 0:
             QMessageBox.information(self, "No selection", "Please select a ticket row first.")
             return
-        item = self.table.item(row, 2)
-        if not item or not item.text().strip():
+        ticket_id = self.model.text(row, 2).strip()
+        if not ticket_id:
             QMessageBox.information(self, "No Ticket ID", "Selected row has no Ticket ID.")
             return
-        ticket_id = item.text().strip()
         self.open_activity_view_for_ticket(ticket_id)
 
     def on_update_ticket_id(self):
-        row = self.table.currentRow()
+        row = self._current_row(self.table)
         if row < 0:
             QMessageBox.information(self, "No selection", "Please select a row to update.")
             return
 
-        item_ticket = self.table.item(row, 2)
-        item_any = self.table.item(row, 0)
-        if not item_ticket or not item_any:
-            QMessageBox.information(self, "Invalid selection", "Selected row is invalid.")
-            return
-
-        old_ticket = item_ticket.text().strip()
-        excel_row_idx = item_any.data(Qt.UserRole)
+        old_ticket = self.model.text(row, 2).strip()
+        excel_row_idx = self.model.excel_row(row)
         if not isinstance(excel_row_idx, int):
             QMessageBox.critical(self, "Error", "Internal reference to Excel row not found.")
             return
@@ -1002,40 +1478,47 @@ class MainWindow(QMainWindow):
             pass
 
         try:
-            update_ticket_id_in_incidents_by_row(EXCEL_PATH, excel_row_idx, new_ticket)
-        except PermissionError as e:
-            QMessageBox.critical(self, "Cannot save", str(e))
-            return
+            has_activity = any_activity_for_ticket(EXCEL_PATH, old_ticket)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to update Ticket ID:\n{e}")
+            QMessageBox.critical(self, "Error", f"Failed to read Activity:\n{e}")
             return
+        rename_activity = False
+        if has_activity:
+            resp = QMessageBox.question(
+                self, "Also update Activity?",
+                f"Activity entries exist for '{old_ticket}'.\n"
+                f"Do you want to rename them to '{new_ticket}' as well?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+            )
+            rename_activity = resp == QMessageBox.Yes
 
-        changed = 0
+        now = datetime.now()
         try:
-            if any_activity_for_ticket(EXCEL_PATH, old_ticket):
-                resp = QMessageBox.question(
-                    self, "Also update Activity?",
-                    f"Activity entries exist for '{old_ticket}'.\n"
-                    f"Do you want to rename them to '{new_ticket}' as well?",
-                    QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
-                )
-                if resp == QMessageBox.Yes:
-                    changed = rename_ticket_id_in_activity(EXCEL_PATH, old_ticket, new_ticket)
-                    self.update_status(f"Ticket ID updated; Activity entries renamed: {changed}")
-                else:
-                    self.update_status("Ticket ID updated (Activity not changed).")
-            else:
-                self.update_status("Ticket ID updated.")
+            changed = rename_ticket_id_everywhere(EXCEL_PATH, excel_row_idx, old_ticket, new_ticket, now,
+                                                  rename_activity)
         except PermissionError as e:
             QMessageBox.critical(self, "Cannot save", str(e))
             return
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to update Activity:\n{e}")
+            QMessageBox.critical(self, "Error", f"Failed to update Ticket ID:\n{e}")
             return
-
-        self.load_table()
+        if rename_activity:  # moved activity changes Updated On for other rows under either ID too
+            self.load_table()
+        else:
+            row = self.model.find_row(excel_row_idx)
+            if row >= 0:
+                self.model.set_cell(row, 1, format_datetime(now))
+                self.model.set_cell(row, 2, new_ticket)
+            record_ticket_seq(self._seq_by_prefix, new_ticket)
         self._select_row_by_excel_row(excel_row_idx)
 
+        if rename_activity:
+            self.update_status(f"Ticket ID updated; Activity entries renamed: {changed}")
+        elif has_activity:
+            self.update_status("Ticket ID updated (Activity not changed).")
+        else:
+            self.update_status("Ticket ID updated.")
+
         if changed > 0 and self._activity_ticket_id == old_ticket:
             self._activity_ticket_id = new_ticket
             self.act_title.setText(f"Activity: {new_ticket}")
@@ -1046,11 +1529,11 @@ class MainWindow(QMainWindow):
     def current_ticket_from_selection_or_edit(self) -> str:
         if self._activity_ticket_id:
             return self._activity_ticket_id
-        row = self.table.currentRow()
+        row = self._current_row(self.table)
         if row >= 0:
-            item = self.table.item(row, 2)
-            if item and item.text().strip():
-                return item.text().strip()
+            ticket_id = self.model.text(row, 2).strip()
+            if ticket_id:
+                return ticket_id
         return self.ticket_edit.text().strip()
 
     def open_activity_view_for_ticket(self, ticket_id: str):
@@ -1070,7 +1553,7 @@ class MainWindow(QMainWindow):
         ticket_id = self._activity_ticket_id
         if not ticket_id:
             self.act_info.setText("No Ticket ID selected.")
-            self.act_table.setRowCount(0)
+            self.act_model.set_rows([])
             return
 
         try:
@@ -1079,17 +1562,8 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to read Activity:\n{e}")
             return
 
-        self.act_table.setRowCount(0)
-        for excel_row, t, start_str, end_str in rows:
-            r = self.act_table.rowCount()
-            self.act_table.insertRow(r)
-            it0 = QTableWidgetItem(t)
-            it1 = QTableWidgetItem(start_str)
-            it2 = QTableWidgetItem(end_str)
-            it0.setData(Qt.UserRole, excel_row)  # store Excel row index for editing
-            self.act_table.setItem(r, 0, it0)
-            self.act_table.setItem(r, 1, it1)
-            self.act_table.setItem(r, 2, it2)
+        self.act_model.set_rows(rows)
+        self._fit_columns(self.act_table)
 
         try:
             open_running = has_open_activity(EXCEL_PATH, ticket_id)
@@ -1102,31 +1576,21 @@ class MainWindow(QMainWindow):
         if not idx.isValid():
             return
         self.act_table.selectRow(idx.row())
-        menu = QMenu(self)
-        act_edit = QAction("Edit record time...", self)
-        act_edit.triggered.connect(self.on_edit_activity_time)
-        menu.addAction(act_edit)
-        menu.exec(self.act_table.viewport().mapToGlobal(pos))
+        self._act_menu.exec(self.act_table.viewport().mapToGlobal(pos))
 
     def on_edit_activity_time(self):
-        row = self.act_table.currentRow()
+        row = self._current_row(self.act_table)
         if row < 0:
             QMessageBox.information(self, "No selection", "Select an activity row to edit.")
             return
-        item_ticket = self.act_table.item(row, 0)
-        item_start = self.act_table.item(row, 1)
-        item_end = self.act_table.item(row, 2)
-        if not item_ticket:
-            QMessageBox.information(self, "Invalid selection", "Selected row is invalid.")
-            return
-        excel_row_idx = item_ticket.data(Qt.UserRole)
+        excel_row_idx = self.act_model.excel_row(row)
         if not isinstance(excel_row_idx, int):
             QMessageBox.critical(self, "Error", "Internal reference to Excel row not found.")
             return
 
-        ticket_id = item_ticket.text().strip()
-        start_dt = parse_dt_str(item_start.text() if item_start else "") or datetime.now()
-        end_dt = parse_dt_str(item_end.text() if item_end else "") or datetime.now()
+        ticket_id = self.act_model.text(row, 0).strip()
+        start_dt = parse_dt_str(self.act_model.text(row, 1)) or datetime.now()
+        end_dt = parse_dt_str(self.act_model.text(row, 2)) or datetime.now()
 
         dlg = EditActivityDialog(self, ticket_id, start_dt, end_dt)
         if dlg.exec() != QDialog.Accepted:
@@ -1134,18 +1598,18 @@ class MainWindow(QMainWindow):
         new_start, new_end = dlg.get_values()
 
         try:
-            wb = ensure_workbook_and_sheet(EXCEL_PATH)
-            ws = wb[ACTIVITY_SHEET_NAME]
-            ws.cell(row=excel_row_idx, column=1, value=ticket_id)
-            ws.cell(row=excel_row_idx, column=2, value=new_start)
-            ws.cell(row=excel_row_idx, column=2).number_format = DATETIME_NUMBER_FORMAT
-            ws.cell(row=excel_row_idx, column=3, value=new_end)
-            if new_end is not None:
-                ws.cell(row=excel_row_idx, column=3).number_format = DATETIME_NUMBER_FORMAT
-            save_workbook_simple(wb, EXCEL_PATH)
-
-            latest_dt = new_end if new_end is not None else new_start
-            update_incident_updated_on_for_ticket(EXCEL_PATH, ticket_id, latest_dt)
+            with WB_CACHE.edit(EXCEL_PATH) as wb:
+                ws = wb[ACTIVITY_SHEET_NAME]
+                ws.cell(row=excel_row_idx, column=1, value=ticket_id)
+                start_cell = ws.cell(row=excel_row_idx, column=2, value=new_start)
+                start_cell.number_format = DATETIME_NUMBER_FORMAT
+                end_cell = ws.cell(row=excel_row_idx, column=3, value=new_end)
+                if new_end is not None:
+                    end_cell.number_format = DATETIME_NUMBER_FORMAT
+                WB_CACHE.set_activity_row_open(ticket_id, excel_row_idx, new_end is None)
+                latest_dt = new_end if new_end is not None else new_start
+                update_incident_updated_on_for_ticket(EXCEL_PATH, ticket_id, latest_dt)
+            refresh_activity_latest(EXCEL_PATH, ticket_id)
         except PermissionError as e:
             QMessageBox.critical(self, "Cannot save", str(e))
             return
@@ -1177,8 +1641,9 @@ class MainWindow(QMainWindow):
 
         now = datetime.now()
         try:
-            append_activity_start(EXCEL_PATH, ticket_id, now)
-            update_incident_updated_on_for_ticket(EXCEL_PATH, ticket_id, now)
+            with WB_CACHE.edit(EXCEL_PATH):
+                row_idx = append_activity_start(EXCEL_PATH, ticket_id, now)
+                update_incident_updated_on_for_ticket(EXCEL_PATH, ticket_id, now)
         except PermissionError as e:
             QMessageBox.critical(self, "Cannot save", str(e))
             return
@@ -1186,10 +1651,12 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to start activity:\n{e}")
             return
 
-        self.update_status(f"Started activity for {ticket_id} at {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        stamp = format_datetime(now)
+        self.update_status(f"Started activity for {ticket_id} at {stamp}")
         if self.stack.currentWidget() is self.page_activity:
-            self.load_activity_table()
-        self.load_table()  # keep main list in sync
+            self.act_model.append_row((row_idx, ticket_id, stamp, ""))
+            self.act_info.setText("Status: Running")
+        self._touch_incident_rows(ticket_id, stamp)  # keep main list in sync
 
     def on_stop_activity(self):
         ticket_id = self.current_ticket_from_selection_or_edit()
@@ -1197,10 +1664,21 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Ticket ID", "Select or open a Ticket ID before stopping.")
             return
 
+        try:
+            if not has_open_activity(EXCEL_PATH, ticket_id):
+                QMessageBox.information(
+                    self, "No open activity",
+                    f"No open activity found for '{ticket_id}'.\nStart one first."
+                )
+                return
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to check activity:\n{e}")
+            return
+
         now = datetime.now()
         try:
-            updated = set_activity_end(EXCEL_PATH, ticket_id, now)
-            if updated:
+            with WB_CACHE.edit(EXCEL_PATH):
+                row_idx = set_activity_end(EXCEL_PATH, ticket_id, now)
                 update_incident_updated_on_for_ticket(EXCEL_PATH, ticket_id, now)
         except PermissionError as e:
             QMessageBox.critical(self, "Cannot save", str(e))
@@ -1209,16 +1687,15 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to stop activity:\n{e}")
             return
 
-        if not updated:
-            QMessageBox.information(
-                self, "No open activity",
-                f"No open activity found for '{ticket_id}'.\nStart one first."
-            )
-        else:
-            self.update_status(f"Stopped activity for {ticket_id} at {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        stamp = format_datetime(now)
+        self.update_status(f"Stopped activity for {ticket_id} at {stamp}")
+        self._touch_incident_rows(ticket_id, stamp)  # keep main list in sync
         if self.stack.currentWidget() is self.page_activity:
-            self.load_activity_table()
-        self.load_table()  # keep main list in sync
+            r = self.act_model.find_row(row_idx)
+            if r >= 0:
+                self.act_model.set_cell(r, 2, stamp)
+            self.act_info.setText("Status: Running" if has_open_activity(EXCEL_PATH, ticket_id)
+                                  else "Status: Stopped")
 
     def on_export_to_onedrive(self):
         onedrive_dir = find_onedrive_dir()
@@ -1237,43 +1714,82 @@ class MainWindow(QMainWindow):
             if resp != QMessageBox.Yes:
                 return
 
-        try:
-            tmp = dest_path.with_suffix(dest_path.suffix + f".tmp.{os.getpid()}")
-            shutil.copy2(EXCEL_PATH, tmp)
-            os.replace(tmp, dest_path)
-        except Exception as e:
-            QMessageBox.critical(self, "Export failed", f"Could not export to OneDrive:\n{e}")
+        if not self._flush_saves():
             return
 
-        self.update_status(f"Exported to {dest_path}")
+        QThreadPool.globalInstance().start(ExportTask(EXCEL_PATH, dest_path, self.export_signals))
+        self.update_status(f"Exporting to {dest_path}…")
+
+    def on_export_done(self, dest: str):
+        self.update_status(f"Exported to {dest}")
+
+    def on_export_failed(self, msg: str):
+        QMessageBox.critical(self, "Export failed", f"Could not export to OneDrive:\n{msg}")
 
     def open_excel(self):
+        if not self._flush_saves():
+            return
         path = str(EXCEL_PATH)
         try:
             if sys.platform.startswith("win"):
                 os.startfile(path)  # type: ignore[attr-defined]
-            elif sys.platform == "darwin":
-                import subprocess
-                subprocess.run(["open", path], check=False)
             else:
                 import subprocess
-                subprocess.run(["xdg-open", path], check=False)
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen([opener, path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 start_new_session=True)  # don't wait for the viewer
         except Exception as e:
             QMessageBox.critical(self, "Open failed", f"Could not open the file:\n{e}")
 
     def update_status(self, text: str):
-        self.status.showMessage(text)
+        self._pending_status = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def on_save_queued(self):
+        self.save_label.setText("Saving…")
+        self._flush_timer.start()
+
+    def on_save_done(self, _path: str):
+        self.save_label.setText("Saved")
+
+    def on_save_failed(self, msg: str):
+        self.save_label.setText("Not saved")
+        QMessageBox.critical(self, "Cannot save", f"Could not save the Excel file:\n{msg}")
+
+    def _flush_saves(self) -> bool:
+        self._flush_timer.stop()
+        QThreadPool.globalInstance().waitForDone()
+        try:
+            WB_CACHE.flush(EXCEL_PATH)
+        except Exception as e:
+            self.on_save_failed(str(e))
+            return False
+        self.save_label.setText("Saved")
+        return True
+
+    def closeEvent(self, event):
+        if not self._flush_saves():
+            resp = QMessageBox.question(
+                self, "Discard changes?",
+                "Recent changes could not be saved.\nQuit anyway and discard them?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if resp != QMessageBox.Yes:
+                event.ignore()
+                return
+        WB_CACHE.signals = None
+        event.accept()
 
 
 def main():
     if sys.platform == "win32":
+        import ctypes
         try:
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("Incident.Tracker.1.1")
         except Exception:
             pass
 
-    ensure_workbook_and_sheet(EXCEL_PATH)
-
     app = QApplication(sys.argv)
     app.setApplicationName(APP_TITLE)
 
@@ -1281,7 +1797,6 @@ def main():
     app.setWindowIcon(ico)
 
     w = MainWindow()
-    w.setWindowIcon(ico)
     w.show()
     sys.exit(app.exec())
 